@@ -46,6 +46,7 @@ DEPENDÊNCIAS:
 
 from __future__ import annotations
 
+import csv
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -53,6 +54,22 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 
+# pyarrow é opcional: quando presente, os CSVs saem pelo writer C++
+# do Arrow (formata colunas em bloco, sem o loop por linha do pandas)
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+    pa_csv = None
+
+# numba também é opcional: funde o cálculo de receita/custo em um único
+# loop paralelo, sem materializar os arrays intermediários do numpy
+try:
+    import numba
+except ImportError:
+    numba = None
+
 
 # ════════════════════════════════════════════════════════════════
 # CONFIGURAÇÃO
@@ -109,6 +126,11 @@ PRODUTO_PROBS = np.array([
 CANAIS = np.array(["PME", "Corporativo", "Grandes Contas", "Setor Público"])
 CANAL_PROBS = np.array([0.40, 0.30, 0.18, 0.12])
 
+# Faixas de quantidade por canal (alinhadas a CANAIS):
+# PME: 1-10, Corporativo: 5-30, Grandes Contas: 20-80, Setor Público: 10-50
+QTD_LO = np.array([1, 5, 20, 10])
+QTD_HI = np.array([11, 31, 81, 51])  # limite superior exclusivo
+
 # ── Regiões ──
 REGIONAIS = np.array(["Norte", "Nordeste", "Centro-Oeste", "Sudeste", "Sul"])
 REGIONAL_PROBS = np.array([0.08, 0.18, 0.10, 0.42, 0.22])
@@ -127,6 +149,18 @@ PRECO_BASE = {
     "Vale Mobilidade":   250,
 }
 
+# Versão array do dicionário acima, alinhada a PRODUTOS: permite buscar
+# o preço por indexação inteira em vez de um hash de string por linha.
+PRECO_BASE_ARR = np.array([PRECO_BASE[p] for p in PRODUTOS], dtype=np.float64)
+
+# ── Fator sazonal por mês (índice 1-12; posição 0 não é usada) ──
+# Janeiro: +3% (reajuste anual) | Fevereiro: -1% (mês curto)
+# Novembro-Dezembro: +2% (efeito fim de ano / gift)
+SAZONAL_TBL = np.array(
+    [1.0, 1.03, 0.99, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.02, 1.02],
+    dtype=np.float32,
+)
+
 
 # ════════════════════════════════════════════════════════════════
 # VALIDAÇÕES
@@ -151,18 +185,25 @@ def _validate_sales_schema(df: pd.DataFrame) -> None:
     if missing:
         raise ValueError(f"Schema incompleto em vendas: {sorted(missing)}")
 
-    if df.isna().sum().sum() > 0:
-        raise ValueError("Há nulos na base de vendas.")
+    # Checagens direto nos ndarrays, coluna a coluna, sem materializar
+    # frames booleanos inteiros (isna().sum().sum() alocava um frame do
+    # tamanho da base só para comparar com zero).
+    for col in df.columns:
+        if df[col].isna().any():
+            raise ValueError("Há nulos na base de vendas.")
 
-    dup = df.duplicated().sum()
-    if dup > 0:
-        raise ValueError(f"Há {dup} linhas duplicadas na base de vendas.")
+    # Duplicatas via hash de linha (C): uma passada de hashing em vez de
+    # fatorar cada coluna separadamente como o duplicated() completo faz
+    if pd.util.hash_pandas_object(df, index=False).duplicated().any():
+        raise ValueError("Há linhas duplicadas na base de vendas.")
 
-    if not df["desconto_pct"].between(0, 0.25).all():
+    desconto = df["desconto_pct"].to_numpy()
+    if ((desconto < 0) | (desconto > 0.25)).any():
         raise ValueError("desconto_pct fora do range [0, 0.25].")
 
-    if (df[["quantidade", "receita", "custo"]] <= 0).any().any():
-        raise ValueError("quantidade/receita/custo devem ser positivos.")
+    for col in ("quantidade", "receita", "custo"):
+        if (df[col].to_numpy() <= 0).any():
+            raise ValueError("quantidade/receita/custo devem ser positivos.")
 
 
 def _validate_forecast_schema(df: pd.DataFrame) -> None:
@@ -182,10 +223,12 @@ def _validate_forecast_schema(df: pd.DataFrame) -> None:
     if missing:
         raise ValueError(f"Schema incompleto em forecast: {sorted(missing)}")
 
-    if df.isna().sum().sum() > 0:
+    # .any() com curto-circuito: dispensa o somatório completo que o
+    # .sum() > 0 fazia só para comparar com zero
+    if df.isna().values.any():
         raise ValueError("Há nulos na base de forecast.")
 
-    if df.duplicated(["mes_ref", "canal", "regional", "produto"]).sum() > 0:
+    if df.duplicated(["mes_ref", "canal", "regional", "produto"]).any():
         raise ValueError("Há duplicidades na chave mes_ref/canal/regional/produto.")
 
 
@@ -193,6 +236,36 @@ def _validate_forecast_schema(df: pd.DataFrame) -> None:
 # GERAÇÃO DOS DADOS
 # ════════════════════════════════════════════════════════════════
 
+if numba is not None:
+    # A assinatura explícita faz o kernel compilar no import (e não na
+    # primeira chamada); com cache=True, execuções seguintes reaproveitam
+    # o binário em disco e pulam o LLVM por completo.
+    @numba.njit(
+        "void(int16[:], float64[:], float32[:], float32[:], float32[:],"
+        " float32[:], float64[:], float64[:])",
+        parallel=True, cache=True, boundscheck=False,
+    )
+    def _receita_custo_kernel(
+        quantidade, preco, sazonal, desconto, ruido, fator_custo,
+        out_receita, out_custo,
+    ):
+        """Funde receita e custo (com pisos) em um único loop paralelo."""
+        for i in numba.prange(quantidade.shape[0]):
+            # (1 - desconto) em float32, como no caminho numpy, para a
+            # saída ser bit a bit igual com e sem numba
+            r = (
+                quantidade[i] * preco[i] * sazonal[i]
+                * (np.float32(1.0) - desconto[i]) * ruido[i]
+            )
+            if r < 30.0:
+                r = 30.0
+            c = r * fator_custo[i]
+            if c < 10.0:
+                c = 10.0
+            out_receita[i] = r
+            out_custo[i] = c
+
+
 def generate_sample_data(config: DataGenConfig) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Gera dados sintéticos determinísticos para vendas e forecast.
@@ -217,93 +290,136 @@ def generate_sample_data(config: DataGenConfig) -> tuple[pd.DataFrame, pd.DataFr
 
     # ── Gerar transações ──
     sampled_dates = rng.choice(dates, size=config.n_rows, replace=True)
-    cliente_id = rng.integers(10_000, 10_000 + config.n_clients, size=config.n_rows)
-    produto = rng.choice(PRODUTOS, size=config.n_rows, p=PRODUTO_PROBS)
-    canal = rng.choice(CANAIS, size=config.n_rows, p=CANAL_PROBS)
+    # Dtypes estreitos onde a faixa permite: cliente_id (< 15 mil) cabe
+    # em int32 e quantidade (< 81) em int16 — metade do tráfego de
+    # memória dos int64 padrão, sem perda de informação.
+    cliente_id = rng.integers(
+        10_000, 10_000 + config.n_clients, size=config.n_rows, dtype=np.int32
+    )
+    # Produto também sai como código inteiro — o array de strings e o
+    # preço derivam dele por indexação.
+    produto_idx = rng.choice(len(PRODUTOS), size=config.n_rows, p=PRODUTO_PROBS)
+    produto = PRODUTOS[produto_idx]
+    # Sortear o canal como código inteiro permite indexar as tabelas de
+    # faixa por canal direto, sem comparar strings linha a linha.
+    canal_idx = rng.choice(len(CANAIS), size=config.n_rows, p=CANAL_PROBS)
+    canal = CANAIS[canal_idx]
     regional = rng.choice(REGIONAIS, size=config.n_rows, p=REGIONAL_PROBS)
 
     # ── Quantidade: funcionários atendidos por transação ──
-    # PME: 1-10, Corporativo: 5-30, Grandes Contas: 20-80, Setor Público: 10-50
-    quantidade = np.where(
-        canal == "PME", rng.integers(1, 11, size=config.n_rows),
-        np.where(
-            canal == "Corporativo", rng.integers(5, 31, size=config.n_rows),
-            np.where(
-                canal == "Grandes Contas", rng.integers(20, 81, size=config.n_rows),
-                rng.integers(10, 51, size=config.n_rows),  # Setor Público
-            )
-        )
-    )
+    # Um único sorteio uniforme escalado pela faixa de cada canal
+    # (QTD_LO/QTD_HI indexadas por canal_idx) substitui quatro passes de
+    # rng.integers costurados com np.where aninhado.
+    u = rng.random(config.n_rows, dtype=np.float32)
+    quantidade = (
+        QTD_LO[canal_idx]
+        + (u * (QTD_HI[canal_idx] - QTD_LO[canal_idx])).astype(np.int64)
+    ).astype(np.int16)
 
     # ── Preço base por produto ──
-    preco_base = pd.Series(produto).map(PRECO_BASE).to_numpy(dtype=float)
+    preco_base = PRECO_BASE_ARR[produto_idx]
 
     # ── Sazonalidade mensal ──
-    # Janeiro: +3% (reajuste anual)
-    # Novembro-Dezembro: +2% (efeito fim de ano / gift)
-    # Fevereiro: -1% (mês curto)
-    mes = pd.DatetimeIndex(sampled_dates).month.to_numpy()
-    sazonal = np.ones(config.n_rows)
-    sazonal[mes == 1] = 1.03    # Reajuste anual
-    sazonal[mes == 2] = 0.99    # Mês curto
-    sazonal[mes == 11] = 1.02   # Fim de ano
-    sazonal[mes == 12] = 1.02   # Fim de ano
+    # O mês sai direto do array datetime64, sem montar um DatetimeIndex
+    # só para isso: truncar para precisão de mês dá "meses desde 1970",
+    # e o resto por 12 recupera o número do mês.
+    data_mes = sampled_dates.astype("datetime64[M]")
+    mes = (data_mes.astype(np.int64) % 12) + 1
+    # Uma única indexação na tabela SAZONAL_TBL (posição = número do mês)
+    # substitui quatro passes de máscara booleana sobre o array inteiro.
+    sazonal = SAZONAL_TBL[mes]
 
     # ── Desconto (0% a 25%) ──
-    # Grandes Contas e Setor Público tendem a negociar mais desconto
-    desconto_base = rng.uniform(0, 0.15, size=config.n_rows)
+    # Grandes Contas e Setor Público tendem a negociar mais desconto.
+    # Sorteios em float32: precisão de ~1e-7 sobra para um percentual
+    # arredondado a 4 casas, com metade do tráfego de memória.
+    desconto_base = rng.random(config.n_rows, dtype=np.float32) * 0.15
+    # Grandes Contas (2) e Setor Público (3): comparação inteira no código
     desconto_extra = np.where(
-        (canal == "Grandes Contas") | (canal == "Setor Público"),
-        rng.uniform(0, 0.10, size=config.n_rows),
+        canal_idx >= 2,
+        rng.random(config.n_rows, dtype=np.float32) * 0.10,
         0,
     )
     desconto_pct = np.clip(desconto_base + desconto_extra, 0, 0.25).round(4)
 
     # ── Receita = quantidade × preço × sazonalidade × (1 - desconto) × ruído ──
-    ruido = rng.normal(1.0, 0.08, size=config.n_rows)
-    receita = (quantidade * preco_base * sazonal * (1 - desconto_pct) * ruido).clip(min=30)
-
     # ── Custo = receita × fator de custo (55% a 82%) ──
-    custo = (receita * rng.uniform(0.55, 0.82, size=config.n_rows)).clip(min=10)
+    # Piso e arredondamento aplicados in-place (out=) sobre os próprios
+    # arrays: evita alocar um float64 extra por coluna. O arredondamento
+    # só acontece depois de derivar o custo, que parte da receita "crua".
+    # ruído e fator de custo também em float32; o produto final promove
+    # para float64 (preço base é float64), então receita/custo mantêm a
+    # precisão de sempre.
+    ruido = 1.0 + rng.standard_normal(config.n_rows, dtype=np.float32) * 0.08
+    fator_custo = 0.55 + rng.random(config.n_rows, dtype=np.float32) * 0.27
+    if numba is not None:
+        # Kernel fundido: lê os 6 arrays de entrada uma vez e escreve os
+        # 2 de saída, sem as temporárias da cadeia de multiplicações.
+        receita = np.empty(config.n_rows)
+        custo = np.empty(config.n_rows)
+        _receita_custo_kernel(
+            quantidade, preco_base, sazonal, desconto_pct, ruido,
+            fator_custo, receita, custo,
+        )
+    else:
+        receita = quantidade * preco_base * sazonal * (1 - desconto_pct) * ruido
+        np.maximum(receita, 30, out=receita)
+        custo = receita * fator_custo
+        np.maximum(custo, 10, out=custo)
+
+    np.round(receita, 2, out=receita)
+    np.round(custo, 2, out=custo)
 
     # ── Montar DataFrame de vendas ──
+    # A ordenação acontece uma única vez, ainda em numpy: argsort estável
+    # sobre as datas e a permutação aplicada a cada array de coluna. O
+    # frame já nasce ordenado, sem o shuffle de blocos do sort_values.
+    # mes_ref ("AAAA-MM") vem da formatação vetorizada do numpy sobre o
+    # array já truncado para mês — muito mais barato que o caminho
+    # dt.to_period("M").astype(str) do pandas.
+    order = np.argsort(sampled_dates, kind="stable")
     sales = pd.DataFrame({
-        "data": pd.to_datetime(sampled_dates),
-        "cliente_id": cliente_id,
-        "produto": produto,
-        "canal": canal,
-        "regional": regional,
-        "quantidade": quantidade,
-        "receita": receita.round(2),
-        "custo": custo.round(2),
-        "desconto_pct": desconto_pct,
-    }).sort_values("data", ignore_index=True)
-
-    sales["mes_ref"] = sales["data"].dt.to_period("M").astype(str)
-    sales = sales[[
-        "data", "mes_ref", "cliente_id", "produto", "canal",
-        "regional", "quantidade", "receita", "custo", "desconto_pct",
-    ]]
+        "data": sampled_dates[order],
+        "mes_ref": data_mes[order].astype(str),
+        "cliente_id": cliente_id[order],
+        "produto": produto[order],
+        "canal": canal[order],
+        "regional": regional[order],
+        "quantidade": quantidade[order],
+        "receita": receita[order],
+        "custo": custo[order],
+        "desconto_pct": desconto_pct[order],
+    }, copy=False)
 
     # ── Gerar forecast (meta e forecast por dimensão × mês) ──
     # Meta = realizado × fator aleatório (0.95 a 1.08)
     # Simula meta definida pela área comercial com variação de ±5-8%
+    # Chaves de agrupamento como category: o groupby opera sobre códigos
+    # inteiros em vez de hashear strings linha a linha. sort=False pula a
+    # reordenação dos grupos e observed=True ignora combinações vazias.
+    chaves = ["mes_ref", "canal", "regional", "produto"]
     monthly = (
-        sales.groupby(["mes_ref", "canal", "regional", "produto"], as_index=False)["receita"]
+        sales.astype({c: "category" for c in chaves})
+        .groupby(chaves, as_index=False, sort=False, observed=True)["receita"]
         .sum()
         .rename(columns={"receita": "realizado"})
     )
-    monthly["meta_receita"] = (
-        monthly["realizado"] * rng.uniform(0.95, 1.08, size=len(monthly))
-    ).round(2)
-    monthly["forecast_receita"] = (
-        monthly["meta_receita"] * rng.uniform(0.96, 1.04, size=len(monthly))
-    ).round(2)
-
+    # Fatores compostos a partir de sorteios unitários em float32 (como
+    # os demais multiplicadores), escalados inline para as faixas-alvo
+    u_meta = rng.random(len(monthly), dtype=np.float32)
+    u_fc = rng.random(len(monthly), dtype=np.float32)
+    meta = monthly["realizado"].to_numpy() * (0.95 + 0.13 * u_meta)
+    np.round(meta, 2, out=meta)
+    monthly["meta_receita"] = meta
+    fc = meta * (0.96 + 0.08 * u_fc)
+    np.round(fc, 2, out=fc)
+    monthly["forecast_receita"] = fc
+
+    # Sem .copy(): a seleção só é lida (validação e to_csv não mutam)
     forecast = monthly[[
         "mes_ref", "canal", "regional", "produto",
         "meta_receita", "forecast_receita",
-    ]].copy()
+    ]]
 
     # ── Validar antes de retornar ──
     _validate_sales_schema(sales)
@@ -312,6 +428,39 @@ def generate_sample_data(config: DataGenConfig) -> tuple[pd.DataFrame, pd.DataFr
     return sales, forecast
 
 
+def _write_csv(df: pd.DataFrame, path: Path) -> None:
+    """
+    Escreve um DataFrame em CSV pelo caminho mais rápido disponível.
+
+    Com pyarrow instalado, usa o writer C++ do Arrow, que formata as
+    colunas em bloco em vez do loop linha a linha do pandas. Colunas
+    datetime são truncadas para date32 para manter o formato AAAA-MM-DD
+    no arquivo. Sem pyarrow, cai no to_csv padrão — a saída é
+    equivalente na leitura (muda apenas o uso de aspas).
+    """
+    if pa_csv is None:
+        # Fallback pandas com formatação enxuta: terminador fixo dispensa
+        # a tradução de os.linesep e QUOTE_NONE pula a checagem de aspas
+        # por linha (os dados gerados não contêm vírgulas nem aspas).
+        # Colunas float32 passam pelo repr curto do numpy ("0.0978" em
+        # vez da expansão em float64 do to_csv), igual ao writer Arrow.
+        f32_cols = df.select_dtypes(include="float32").columns
+        if len(f32_cols):
+            df = df.copy(deep=False)
+            df[f32_cols] = df[f32_cols].astype(str)
+        df.to_csv(
+            path, index=False, encoding="utf-8",
+            lineterminator="\n", quoting=csv.QUOTE_NONE,
+        )
+        return
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    for i, campo in enumerate(table.schema):
+        if pa.types.is_timestamp(campo.type):
+            table = table.set_column(i, campo.name, table.column(i).cast(pa.date32()))
+    pa_csv.write_csv(table, path)
+
+
 # ════════════════════════════════════════════════════════════════
 # EXECUÇÃO PRINCIPAL
 # ════════════════════════════════════════════════════════════════
@@ -342,8 +491,8 @@ def main() -> None:
     sales_path = DATA_DIR / "base_vendas_historica.csv"
     forecast_path = DATA_DIR / "forecast_mensal.csv"
 
-    sales.to_csv(sales_path, index=False, encoding="utf-8")
-    forecast.to_csv(forecast_path, index=False, encoding="utf-8")
+    _write_csv(sales, sales_path)
+    _write_csv(forecast, forecast_path)
 
     # ── Resumo dos dados gerados ──
     print("\n✅ Dados gerados com sucesso!")
@@ -46,7 +46,7 @@ def save_excel_with_sheets(
     sheets: Dict[str, pd.DataFrame],
     *,
     index: bool = False,
-    engine: str = "openpyxl",
+    engine: Optional[str] = None,
     freeze_panes: Optional[tuple] = (1, 0),
 ) -> Path:
     """
@@ -56,7 +56,8 @@ def save_excel_with_sheets(
         filepath: caminho completo do arquivo .xlsx
         sheets: dicionário {nome_da_aba: DataFrame}
         index: se True, inclui o índice do DataFrame como coluna
-        engine: engine do ExcelWriter (padrão: openpyxl)
+        engine: engine do ExcelWriter. Padrão (None): usa xlsxwriter em
+                modo constant_memory se instalado, senão openpyxl
         freeze_panes: posição de congelamento (linha, coluna)
                       padrão (1, 0) = congela a primeira linha (cabeçalho)
 
@@ -67,28 +68,61 @@ def save_excel_with_sheets(
         "Freeze panes" congela o cabeçalho da planilha — quando
         você rola para baixo, os nomes das colunas ficam visíveis.
         É um detalhe pequeno que faz diferença na usabilidade.
+
+        Já o "constant_memory" do xlsxwriter faz as linhas irem direto
+        para o disco em vez de montar a planilha inteira na memória —
+        para as abas de detalhe (as maiores), isso reduz bastante o
+        pico de RAM e o tempo de escrita.
     """
     out_path = ensure_parent_dir(filepath)
 
     # Nomes de aba no Excel têm limite de 31 caracteres
     normalized_sheets = {}
     for name, df in sheets.items():
-        normalized_sheets[str(name)[:31]] = df.copy()
+        # Colunas categóricas viram string antes da escrita: o caminho
+        # streaming do xlsxwriter escreve célula a célula e não conhece
+        # o dtype category do pandas.
+        cat_cols = df.select_dtypes(include="category").columns
+        if len(cat_cols):
+            # Cópia rasa + copy-on-write: só as colunas convertidas são
+            # materializadas; o frame do chamador fica intacto.
+            df = df.copy(deep=False)
+            df[cat_cols] = df[cat_cols].astype(str)
+        normalized_sheets[str(name)[:31]] = df
+
+    if engine is None:
+        try:
+            import xlsxwriter  # noqa: F401 — só checa disponibilidade
+            engine = "xlsxwriter"
+        except ImportError:
+            engine = "openpyxl"
 
-    with pd.ExcelWriter(out_path, engine=engine) as writer:
+    engine_kwargs = (
+        {"options": {"constant_memory": True}} if engine == "xlsxwriter" else {}
+    )
+
+    with pd.ExcelWriter(out_path, engine=engine, engine_kwargs=engine_kwargs) as writer:
         for sheet_name, df in normalized_sheets.items():
             df.to_excel(writer, sheet_name=sheet_name, index=index)
 
-        # Aplicar freeze panes em todas as abas
+        # Aplicar freeze panes em todas as abas (API varia por engine)
         try:
-            workbook = writer.book
-            for sheet_name in normalized_sheets.keys():
-                ws = workbook[sheet_name]
-                if freeze_panes is not None:
-                    row, col = freeze_panes
-                    ws.freeze_panes = ws.cell(row=row + 1, column=col + 1)
+            if freeze_panes is not None:
+                row, col = freeze_panes
+                if engine == "xlsxwriter":
+                    for ws in writer.book.worksheets():
+                        ws.freeze_panes(row, col)
+                else:
+                    # openpyxl aceita o endereço como string — evita o
+                    # ws.cell(), que percorre/cria o objeto de célula
+                    from openpyxl.utils import get_column_letter
+
+                    endereco = f"{get_column_letter(col + 1)}{row + 1}"
+                    workbook = writer.book
+                    for sheet_name in normalized_sheets.keys():
+                        workbook[sheet_name].freeze_panes = endereco
         except Exception:
-            # Se falhar (versão do openpyxl), segue sem congelar
+            # Se falhar (versão do engine), segue sem congelar
             pass
 
     return out_path
@@ -102,6 +136,7 @@ def save_portfolio_table(
     parametros: Optional[pd.DataFrame] = None,
     *,
     index: bool = False,
+    engine: Optional[str] = None,
 ) -> Path:
     """
     Salva um Excel no padrão do portfólio (3 abas padronizadas).
@@ -118,6 +153,9 @@ def save_portfolio_table(
         detalhe: DataFrame com os dados detalhados
         parametros: DataFrame com os parâmetros usados (opcional)
         index: se True, inclui o índice como coluna
+        engine: engine do ExcelWriter repassado a save_excel_with_sheets.
+                Padrão (None): xlsxwriter em modo constant_memory se
+                instalado, senão openpyxl
 
     Retorna:
         Path do arquivo criado
@@ -132,4 +170,6 @@ def save_portfolio_table(
     if parametros is not None:
         sheets["parametros"] = parametros
 
-    return save_excel_with_sheets(outputs_dir / filename, sheets, index=index)
+    return save_excel_with_sheets(
+        outputs_dir / filename, sheets, index=index, engine=engine
+    )
@@ -27,6 +27,8 @@ QUANDO USAR:
 
 from __future__ import annotations
 
+import os
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Tuple
@@ -67,15 +69,16 @@ def _check_analysis_outputs(analysis_dir: Path) -> Tuple[bool, List[str]]:
         (ok, missing): True se tudo existe, lista dos faltantes
     """
     outputs_dir = analysis_dir / "outputs"
-    missing: List[str] = []
 
-    if not outputs_dir.exists() or not outputs_dir.is_dir():
+    # Um único os.scandir lista a pasta inteira em uma syscall, em vez
+    # de um stat por arquivo obrigatório (+ exists/is_dir da pasta).
+    try:
+        with os.scandir(outputs_dir) as entries:
+            names = {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
         return False, REQUIRED_OUTPUT_FILES.copy()
 
-    for fname in REQUIRED_OUTPUT_FILES:
-        if not (outputs_dir / fname).exists():
-            missing.append(fname)
-
+    missing = [fname for fname in REQUIRED_OUTPUT_FILES if fname not in names]
     return (len(missing) == 0), missing
 
 
@@ -88,9 +91,13 @@ def main() -> int:
         antes de publicar o projeto, verificamos se todos
         os artefatos obrigatórios foram gerados corretamente.
     """
-    print("\n" + "🔍" * 30)
-    print("  QUALITY GATE — VALIDAÇÃO DE OUTPUTS")
-    print("🔍" * 30)
+    # O relatório é acumulado em uma lista e emitido em uma única
+    # escrita no final: com stdout em modo linha (pipe/CI), cada print
+    # viraria uma syscall de write separada.
+    lines: List[str] = []
+    lines.append("\n" + "🔍" * 30)
+    lines.append("  QUALITY GATE — VALIDAÇÃO DE OUTPUTS")
+    lines.append("🔍" * 30)
 
     issues: List[ValidationIssue] = []
 
@@ -99,9 +106,9 @@ def main() -> int:
         ok, missing = _check_analysis_outputs(analysis_dir)
 
         if ok:
-            print(f"   ✅ {analysis}")
+            lines.append(f"   ✅ {analysis}")
         else:
-            print(f"   ❌ {analysis} — faltam {len(missing)} arquivo(s)")
+            lines.append(f"   ❌ {analysis} — faltam {len(missing)} arquivo(s)")
             issues.append(
                 ValidationIssue(
                     analysis=analysis,
@@ -112,26 +119,30 @@ def main() -> int:
 
     # ── Resultado final ──
     if issues:
-        print("\n" + "=" * 60)
-        print("❌ QUALITY GATE FAILED — outputs obrigatórios ausentes.\n")
+        lines.append("\n" + "=" * 60)
+        lines.append("❌ QUALITY GATE FAILED — outputs obrigatórios ausentes.\n")
         for issue in issues:
-            print(f"📂 {issue.analysis}")
-            print(f"   Pasta: {issue.outputs_dir}")
+            lines.append(f"📂 {issue.analysis}")
+            lines.append(f"   Pasta: {issue.outputs_dir}")
             for mf in issue.missing_files:
-                print(f"   • faltando: {mf}")
-            print()
-        print("Ação: gere os outputs faltantes executando cada análise:")
-        print("   python generate_sample_data.py")
+                lines.append(f"   • faltando: {mf}")
+            lines.append("")
+        lines.append("Ação: gere os outputs faltantes executando cada análise:")
+        lines.append("   python generate_sample_data.py")
         for analysis in ANALYSES:
             script_name = analysis.split("_", 1)[1]
-            print(f"   python {analysis}/scripts/analise_{script_name.split('_')[0]}.py")
-        print()
-        return 1
-
-    print("\n" + "=" * 60)
-    print("✅ QUALITY GATE PASSED — todos os outputs obrigatórios presentes.")
-    print("=" * 60)
-    return 0
+            lines.append(
+                f"   python {analysis}/scripts/analise_{script_name.split('_')[0]}.py"
+            )
+        lines.append("")
+    else:
+        lines.append("\n" + "=" * 60)
+        lines.append("✅ QUALITY GATE PASSED — todos os outputs obrigatórios presentes.")
+        lines.append("=" * 60)
+
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+    return 1 if issues else 0
 
 
 if __name__ == "__main__":